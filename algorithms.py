@@ -1,259 +1,335 @@
+from array import array
 from collections import deque
-from typing import Tuple, List, Set, Optional, Dict
-from utils import SearchNode, PathfindingHeap, fetch_adjacent_nodes, compute_step_weight, trace_back_path
+import heapq
+from typing import Tuple, List, Optional, Dict
+from utils import trace_back_path, SearchState
 from grid import NavigationGrid
-import time
+from headless_search import bfs_kernel, dfs_kernel, ucs_kernel
+
+FRONTIER, VISITED, ACTIVE = NavigationGrid.STATE_FRONTIER, NavigationGrid.STATE_VISITED, NavigationGrid.STATE_ACTIVE
 
 class SearchTechniques:
     """Implementations of various graph search algorithms for navigation."""
 
-    def __init__(self, nav_grid: NavigationGrid, wait_time: float = 0.05):
+    def __init__(self, nav_grid: NavigationGrid, wait_time: float = 0.05, render_every: Optional[int] = None):
         self.nav_map = nav_grid
         self.latency = wait_time
         self.current_algo_tag = ""
 
-    def _refresh_view(self, extra_info=""):
-        """Triggers a grid visualization update."""
+        # Only every Nth expansion is drawn; by default aim for roughly 20 frames per second of delay
+        if render_every is None:
+            render_every = int(1 / max(wait_time, 1e-6) / 20)
+        self._render_every = max(1, render_every)
+        self._tick = 0
+
+    def _refresh_view(self, extra_info="", skippable=False):
+        """Triggers a grid visualization update, skipping frames except for status messages."""
+        tick = self._tick
+        self._tick += 1
+        if tick % self._render_every and (skippable or not extra_info):
+            return
         if self.latency > 0:
             self.nav_map.render_frame(
                 header=f"{self.current_algo_tag}{extra_info}",
                 delay=self.latency
             )
 
+    def _run_headless(self, kernel, *extra_args) -> Optional[List[Tuple[int, int]]]:
+        """Runs a headless_search kernel with no animation, recording expanded cells and the route."""
+        W = self.nav_map.cols
+        origin = self.nav_map.start_pos[0] * W + self.nav_map.start_pos[1]
+        goal = self.nav_map.goal_pos[0] * W + self.nav_map.goal_pos[1]
+        expanded = []
+        parent = kernel(self.nav_map.neighbor_table, origin, goal, expanded, *extra_args)
+        self.nav_map.cell_state.reshape(-1)[expanded] = VISITED
+        if parent is None:
+            return None
+        final_route = trace_back_path(parent, goal, origin, W)
+        self.nav_map.trajectory = final_route
+        return final_route
+
     def run_bfs(self) -> Optional[List[Tuple[int, int]]]:
         """Executes Breadth-First Search."""
         self.current_algo_tag = "BFS Algorithm"
+        self._tick = 0
         self.nav_map.clear_render_state()
-
-        origin, goal = self.nav_map.start_pos, self.nav_map.goal_pos
-        work_queue = deque([SearchNode(origin)])
-        seen_coords = {origin}
-        path_tracker = {origin: None}
-        self.nav_map.front_nodes.add(origin)
-
-        while work_queue:
-            node_to_check = work_queue.popleft()
-            pos = node_to_check.coord
-
-            self.nav_map.active_node = pos
-            self.nav_map.history.add(pos)
-            if pos in self.nav_map.front_nodes:
-                self.nav_map.front_nodes.remove(pos)
-
+        if self.latency == 0:
+            return self._run_headless(bfs_kernel)
+
+        state = self.nav_map.state_buf
+        nbrs, W = self.nav_map.neighbor_table, self.nav_map.cols
+        origin = self.nav_map.start_pos[0] * W + self.nav_map.start_pos[1]
+        goal = self.nav_map.goal_pos[0] * W + self.nav_map.goal_pos[1]
+        work_queue = deque([origin])
+        # Flat parent buffer; -1 marks cells not yet seen, the origin is its own parent
+        path_tracker = array('i', [-1]) * len(nbrs)
+        path_tracker[origin] = origin
+        state[origin] = FRONTIER
+
+        found = origin == goal
+        while work_queue and not found:
+            pos = work_queue.popleft()
+
+            state[pos] = ACTIVE
             self._refresh_view()
+            state[pos] = VISITED
 
-            if pos == goal:
-                final_route = trace_back_path(path_tracker, goal, origin)
-                self.nav_map.trajectory = final_route
-                self.nav_map.active_node = None
-                self._refresh_view(" - Target Acquired!")
-                return final_route
-
-            for next_step in fetch_adjacent_nodes(pos, self.nav_map.rows, self.nav_map.cols):
-                if next_step not in seen_coords and self.nav_map.is_traversable(next_step):
-                    seen_coords.add(next_step)
+            for next_step in nbrs[pos]:
+                if path_tracker[next_step] == -1:
                     path_tracker[next_step] = pos
-                    work_queue.append(SearchNode(next_step, node_to_check))
-                    self.nav_map.front_nodes.add(next_step)
+                    work_queue.append(next_step)
+                    state[next_step] = FRONTIER
+                    # Every step costs the same, so the first discovery of the goal is a shortest path
+                    if next_step == goal:
+                        found = True
+                        break
+
+        if found:
+            state[goal] = VISITED
+            final_route = trace_back_path(path_tracker, goal, origin, W)
+            self.nav_map.trajectory = final_route
+            self._refresh_view(" - Target Acquired!")
+            return final_route
+        self._refresh_view(" - No Path Found")
         return None
 
     def run_dfs(self) -> Optional[List[Tuple[int, int]]]:
         """Executes Depth-First Search."""
         self.current_algo_tag = "DFS Algorithm"
+        self._tick = 0
         self.nav_map.clear_render_state()
-
-        origin, goal = self.nav_map.start_pos, self.nav_map.goal_pos
-        work_stack = [SearchNode(origin)]
-        visited_registry = set()
-        path_tracker = {origin: None}
-        self.nav_map.front_nodes.add(origin)
+        if self.latency == 0:
+            return self._run_headless(dfs_kernel)
+
+        state = self.nav_map.state_buf
+        nbrs, W = self.nav_map.neighbor_table, self.nav_map.cols
+        origin = self.nav_map.start_pos[0] * W + self.nav_map.start_pos[1]
+        goal = self.nav_map.goal_pos[0] * W + self.nav_map.goal_pos[1]
+        work_stack = [origin]
+        visited = bytearray(len(nbrs))
+        # Cells currently on the stack are not pushed again, so each cell is pushed once
+        stacked = bytearray(len(nbrs))
+        stacked[origin] = 1
+        path_tracker = array('i', [-1]) * len(nbrs)
+        path_tracker[origin] = origin
+        state[origin] = FRONTIER
 
         while work_stack:
-            node_to_check = work_stack.pop()
-            pos = node_to_check.coord
-
-            if pos in visited_registry:
-                continue
-            visited_registry.add(pos)
-
-            self.nav_map.active_node = pos
-            self.nav_map.history.add(pos)
-            if pos in self.nav_map.front_nodes:
-                self.nav_map.front_nodes.remove(pos)
+            pos = work_stack.pop()
+            stacked[pos] = 0
+            visited[pos] = 1
 
+            state[pos] = ACTIVE
             self._refresh_view()
+            state[pos] = VISITED
 
             if pos == goal:
-                final_route = trace_back_path(path_tracker, goal, origin)
+                final_route = trace_back_path(path_tracker, goal, origin, W)
                 self.nav_map.trajectory = final_route
-                self.nav_map.active_node = None
                 self._refresh_view(" - Goal Reached!")
                 return final_route
 
-            neighbors = fetch_adjacent_nodes(pos, self.nav_map.rows, self.nav_map.cols)
-            for adj in reversed(neighbors):
-                if adj not in visited_registry and self.nav_map.is_traversable(adj):
+            for adj in reversed(nbrs[pos]):
+                if not stacked[adj] and not visited[adj]:
+                    stacked[adj] = 1
                     path_tracker[adj] = pos
-                    work_stack.append(SearchNode(adj, node_to_check))
-                    self.nav_map.front_nodes.add(adj)
+                    work_stack.append(adj)
+                    state[adj] = FRONTIER
+        self._refresh_view(" - No Path Found")
         return None
 
     def run_ucs(self) -> Optional[List[Tuple[int, int]]]:
         """Executes Uniform-Cost Search."""
         self.current_algo_tag = "UCS Algorithm"
+        self._tick = 0
         self.nav_map.clear_render_state()
-
-        origin, goal = self.nav_map.start_pos, self.nav_map.goal_pos
-        priority_heap = PathfindingHeap()
-        priority_heap.push(SearchNode(origin, weight=0), 0)
-
-        permanent_set = set()
-        path_tracker = {origin: None}
-        accumulated_costs = {origin: 0}
-        self.nav_map.front_nodes.add(origin)
-
-        while not priority_heap.is_empty():
-            node = priority_heap.pop()
-            pos = node.coord
-
-            if pos in permanent_set:
+        if self.latency == 0:
+            return self._run_headless(ucs_kernel, self.nav_map.edge_cost_table)
+
+        state = self.nav_map.state_buf
+        nbrs, W = self.nav_map.neighbor_table, self.nav_map.cols
+        step_costs = self.nav_map.edge_cost_table
+        origin = self.nav_map.start_pos[0] * W + self.nav_map.start_pos[1]
+        goal = self.nav_map.goal_pos[0] * W + self.nav_map.goal_pos[1]
+        # Heap entries are (cost, insertion counter, cell); the counter keeps ties FIFO.
+        # Improved costs are pushed again, and an entry whose cost is above the cell's
+        # recorded cost is stale and skipped when popped.
+        priority_heap = [(0, 0, origin)]
+        counter = 0
+
+        # Per-cell search state lives in parallel flat arrays indexed by packed cell
+        search = SearchState(len(nbrs), origin)
+        path_tracker, accumulated_costs = search.parent, search.cost
+        state[origin] = FRONTIER
+
+        heappush, heappop = heapq.heappush, heapq.heappop
+        while priority_heap:
+            base_cost, _, pos = heappop(priority_heap)
+
+            if base_cost > accumulated_costs[pos]:
                 continue
-            permanent_set.add(pos)
-
-            self.nav_map.active_node = pos
-            self.nav_map.history.add(pos)
-            if pos in self.nav_map.front_nodes:
-                self.nav_map.front_nodes.remove(pos)
 
+            state[pos] = ACTIVE
             self._refresh_view()
+            state[pos] = VISITED
 
             if pos == goal:
-                final_route = trace_back_path(path_tracker, goal, origin)
+                final_route = trace_back_path(path_tracker, goal, origin, W)
                 self.nav_map.trajectory = final_route
-                self.nav_map.active_node = None
                 self._refresh_view(f" - Optimized Path Found! Cost: {accumulated_costs[goal]:.2f}")
                 return final_route
 
-            for neighbor in fetch_adjacent_nodes(pos, self.nav_map.rows, self.nav_map.cols):
-                if self.nav_map.is_traversable(neighbor):
-                    step_cost = compute_step_weight(pos, neighbor)
-                    newly_computed_cost = accumulated_costs[pos] + step_cost
-                    if neighbor not in accumulated_costs or newly_computed_cost < accumulated_costs[neighbor]:
-                        accumulated_costs[neighbor] = newly_computed_cost
-                        path_tracker[neighbor] = pos
-                        priority_heap.push(SearchNode(neighbor, node, newly_computed_cost), newly_computed_cost)
-                        self.nav_map.front_nodes.add(neighbor)
+            for neighbor, step_cost in zip(nbrs[pos], step_costs[pos]):
+                newly_computed_cost = base_cost + step_cost
+                if newly_computed_cost < accumulated_costs[neighbor]:
+                    accumulated_costs[neighbor] = newly_computed_cost
+                    path_tracker[neighbor] = pos
+                    counter += 1
+                    heappush(priority_heap, (newly_computed_cost, counter, neighbor))
+                    state[neighbor] = FRONTIER
+        self._refresh_view(" - No Path Found")
         return None
 
     def run_dls(self, depth_cap: int = 15) -> Optional[List[Tuple[int, int]]]:
         """Executes Depth-Limited Search."""
         self.current_algo_tag = f"DLS (Max Depth: {depth_cap})"
+        self._tick = 0
         self.nav_map.clear_render_state()
-        return self._perform_recursive_dls(self.nav_map.start_pos, depth_cap, {self.nav_map.start_pos: None}, set())
-
-    def _perform_recursive_dls(self, current, remaining_depth, links, explored) -> Optional[List[Tuple[int, int]]]:
-        """Recursive helper for depth-limited search."""
-        self.nav_map.active_node = current
-        self.nav_map.history.add(current)
-        if current in self.nav_map.front_nodes:
-            self.nav_map.front_nodes.remove(current)
-        self._refresh_view()
-
-        if current == self.nav_map.goal_pos:
-            route = trace_back_path(links, self.nav_map.goal_pos, self.nav_map.start_pos)
-            self.nav_map.trajectory = route
-            self.nav_map.active_node = None
-            self._refresh_view(" - Path Found!")
-            return route
-
-        if remaining_depth <= 0:
-            return None
-
-        explored.add(current)
-        adjacent = fetch_adjacent_nodes(current, self.nav_map.rows, self.nav_map.cols)
-        
-        # Identify frontier nodes for visualization
-        for loc in adjacent:
-            if loc not in explored and self.nav_map.is_traversable(loc):
-                self.nav_map.front_nodes.add(loc)
-
-        for loc in adjacent:
-            if loc not in explored and self.nav_map.is_traversable(loc):
-                links[loc] = current
-                outcome = self._perform_recursive_dls(loc, remaining_depth - 1, links, explored)
-                if outcome:
-                    return outcome
-        explored.remove(current)
-        return None
+        origin = self.nav_map.start_pos[0] * self.nav_map.cols + self.nav_map.start_pos[1]
+        route = self._perform_dls(origin, depth_cap)
+        if route is None:
+            self._refresh_view(" - No Path Within Depth Limit")
+        return route
+
+    def _perform_dls(self, origin: int, depth_cap: int, depth_memo: Optional[Dict[int, int]] = None) -> Optional[List[Tuple[int, int]]]:
+        """Depth-limited search from a packed origin, using an explicit stack instead of recursion.
+
+        When depth_memo is given it maps cells to the largest remaining depth they were
+        entered with, and cells reached again with no more depth to spare are skipped.
+        """
+        state = self.nav_map.state_buf
+        nbrs, W = self.nav_map.neighbor_table, self.nav_map.cols
+        goal = self.nav_map.goal_pos[0] * W + self.nav_map.goal_pos[1]
+        # explored flags the cells on the current path, so a branch never loops back onto itself
+        links, explored = array('i', [-1]) * len(nbrs), bytearray(len(nbrs))
+        links[origin] = origin
+
+        # Each entry is (cell, remaining depth, iterator over its unvisited children)
+        stack = []
+        current, remaining_depth = origin, depth_cap
+        while True:
+            state[current] = ACTIVE
+            self._refresh_view()
+            state[current] = VISITED
+            if depth_memo is not None:
+                depth_memo[current] = remaining_depth
+
+            if current == goal:
+                route = trace_back_path(links, goal, origin, W)
+                self.nav_map.trajectory = route
+                self._refresh_view(" - Path Found!")
+                return route
+
+            if remaining_depth > 0:
+                explored[current] = 1
+                adjacent = nbrs[current]
+
+                # Identify frontier nodes for visualization
+                for loc in adjacent:
+                    if not explored[loc] and not state[loc]:
+                        state[loc] = FRONTIER
+                stack.append((current, remaining_depth, iter(adjacent)))
+
+            # Descend into the next unexplored child, backtracking out of exhausted cells
+            while stack:
+                parent, parent_depth, children = stack[-1]
+                for loc in children:
+                    if not explored[loc] and (depth_memo is None or depth_memo.get(loc, -1) < parent_depth - 1):
+                        links[loc] = parent
+                        current, remaining_depth = loc, parent_depth - 1
+                        break
+                else:
+                    stack.pop()
+                    explored[parent] = 0
+                    continue
+                break
+            else:
+                return None
 
     def run_iddfs(self, upper_limit: int = 25) -> Optional[List[Tuple[int, int]]]:
         """Executes Iterative Deepening Depth-First Search."""
         self.current_algo_tag = "IDDFS Search"
+        self._tick = 0
+        origin = self.nav_map.start_pos[0] * self.nav_map.cols + self.nav_map.start_pos[1]
+
+        # Shared across depths: once a pass fails, no cell can reach the goal within the
+        # depth it was entered with, so later passes need not re-enter it with that much or less
+        depth_memo = {}
         for current_max in range(upper_limit + 1):
             self.nav_map.clear_render_state()
-            found_path = self._perform_recursive_dls(self.nav_map.start_pos, current_max, {self.nav_map.start_pos: None}, set())
+            found_path = self._perform_dls(origin, current_max, depth_memo)
             if found_path:
                 return found_path
+        self._refresh_view(" - No Path Found")
         return None
 
     def run_bi_search(self) -> Optional[List[Tuple[int, int]]]:
         """Executes Bidirectional Breadth-First Search."""
         self.current_algo_tag = "Bidirectional Pathmaking"
+        self._tick = 0
         self.nav_map.clear_render_state()
 
-        start, finish = self.nav_map.start_pos, self.nav_map.goal_pos
+        state = self.nav_map.state_buf
+        W = self.nav_map.cols
+        start = self.nav_map.start_pos[0] * W + self.nav_map.start_pos[1]
+        finish = self.nav_map.goal_pos[0] * W + self.nav_map.goal_pos[1]
         fwd_work, bwd_work = deque([start]), deque([finish])
-        fwd_map, bwd_map = {start: None}, {finish: None}
-        self.nav_map.front_nodes.add(start)
-        self.nav_map.front_nodes.add(finish)
+        # Flat parent buffers for each side; -1 marks cells that side has not reached
+        cell_count = len(self.nav_map.neighbor_table)
+        fwd_map, bwd_map = array('i', [-1]) * cell_count, array('i', [-1]) * cell_count
+        fwd_map[start], bwd_map[finish] = start, finish
+        state[start] = FRONTIER
+        state[finish] = FRONTIER
 
         while fwd_work and bwd_work:
-            # Step forward
-            node_f = fwd_work.popleft()
-            self.nav_map.active_node = node_f
-            self.nav_map.history.add(node_f)
-            self._refresh_view(" (Exploring Forward)")
-            if node_f in bwd_map:
-                return self._bridge_bi_directional_paths(fwd_map, bwd_map, node_f)
-            
-            for adj in fetch_adjacent_nodes(node_f, self.nav_map.rows, self.nav_map.cols):
-                if adj not in fwd_map and self.nav_map.is_traversable(adj):
-                    fwd_map[adj] = node_f
-                    fwd_work.append(adj)
-                    self.nav_map.front_nodes.add(adj)
-
-            # Step backward
-            node_b = bwd_work.popleft()
-            self.nav_map.active_node = node_b
-            self.nav_map.history.add(node_b)
-            self._refresh_view(" (Exploring Backward)")
-            if node_b in fwd_map:
-                return self._bridge_bi_directional_paths(fwd_map, bwd_map, node_b)
-            
-            for adj in fetch_adjacent_nodes(node_b, self.nav_map.rows, self.nav_map.cols):
-                if adj not in bwd_map and self.nav_map.is_traversable(adj):
-                    bwd_map[adj] = node_b
-                    bwd_work.append(adj)
-                    self.nav_map.front_nodes.add(adj)
+            # Grow whichever side has the smaller frontier
+            if len(fwd_work) <= len(bwd_work):
+                junction = self._expand_bi_frontier(fwd_work, fwd_map, bwd_map, " (Exploring Forward)")
+            else:
+                junction = self._expand_bi_frontier(bwd_work, bwd_map, fwd_map, " (Exploring Backward)")
+            if junction != -1:
+                return self._bridge_bi_directional_paths(fwd_map, bwd_map, junction)
+        self._refresh_view(" - No Path Found")
         return None
 
+    def _expand_bi_frontier(self, work, own_links, other_links, label) -> int:
+        """Expands one node of a bidirectional frontier; returns the meeting cell or -1."""
+        state = self.nav_map.state_buf
+        node = work.popleft()
+        state[node] = ACTIVE
+        self._refresh_view(label, skippable=True)
+        state[node] = VISITED
+        if other_links[node] != -1:
+            return node
+
+        for adj in self.nav_map.neighbor_table[node]:
+            if own_links[adj] == -1:
+                own_links[adj] = node
+                # Meeting the other search while enqueueing saves expanding up to its frontier
+                if other_links[adj] != -1:
+                    return adj
+                work.append(adj)
+                state[adj] = FRONTIER
+        return -1
+
     def _bridge_bi_directional_paths(self, f_links, b_links, junction):
         """Combines paths from start and goal when they meet."""
-        f_part = []
-        scanner = junction
-        while scanner is not None:
-            f_part.append(scanner)
-            scanner = f_links[scanner]
-        f_part.reverse()
-
-        b_part = []
-        scanner = b_links[junction]
-        while scanner is not None:
-            b_part.append(scanner)
-            scanner = b_links[scanner]
-
-        complete_route = f_part + b_part
+        W = self.nav_map.cols
+        start = self.nav_map.start_pos[0] * W + self.nav_map.start_pos[1]
+        finish = self.nav_map.goal_pos[0] * W + self.nav_map.goal_pos[1]
+        # The backward half runs goal -> junction; drop the shared junction and flip it
+        backward = trace_back_path(b_links, junction, finish, W)
+        complete_route = trace_back_path(f_links, junction, start, W) + backward[-2::-1]
         self.nav_map.trajectory = complete_route
-        self.nav_map.active_node = None
         self._refresh_view(" - Bi-directional Match Found!")
         return complete_route
\ No newline at end of file
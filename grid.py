@@ -2,8 +2,8 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.widgets import Button
 import numpy as np
-import random
 from typing import Tuple, List, Set, Optional
+from utils import OFFSETS, WEIGHTS
 
 class NavigationGrid:
     """Manages the environment and visual representation of the search space with GUI controls."""
@@ -13,15 +13,23 @@ class NavigationGrid:
     CELL_BEGIN = 2
     CELL_GOAL = 3
 
-    def __init__(self, height: int, width: int, block_rate: float = 0.2):
+    STATE_UNSEEN = 0
+    STATE_FRONTIER = 1
+    STATE_VISITED = 2
+    STATE_ACTIVE = 3
+    STATE_PALETTE = np.array([(1.0, 1.0, 1.0), (0.5, 0.8, 0.9), (0.8, 0.8, 0.8), (1.0, 0.5, 0.0)], dtype=np.float32)
+
+    def __init__(self, height: int, width: int, block_rate: float = 0.2, seed: Optional[int] = None):
         self.rows = height
         self.cols = width
-        self.matrix = np.zeros((height, width), dtype=int)
+        self.matrix = np.zeros((height, width), dtype=np.int8)
+        self._rng = np.random.default_rng(seed)
         self.start_pos, self.goal_pos = None, None
 
-        self.front_nodes = set()
-        self.history = set()
-        self.active_node = None
+        # One STATE_* byte per cell: searches write to the byte buffer,
+        # the (rows, cols) uint8 array is a view of the same memory used for rendering
+        self.state_buf = bytearray(height * width)
+        self.cell_state = np.frombuffer(self.state_buf, dtype=np.uint8).reshape(height, width)
         self.trajectory = []
         self.display_fig, self.display_ax = None, None
         
@@ -33,35 +41,71 @@ class NavigationGrid:
 
     def initialize_map(self, density: float):
         """Generates the grid with random obstacles, start, and target."""
-        self.matrix.fill(self.CELL_OPEN)
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if random.random() < density:
-                    self.matrix[r][c] = self.CELL_BLOCK
+        rng = self._rng
+        self.matrix[:] = np.where(rng.random((self.rows, self.cols)) < density, self.CELL_BLOCK, self.CELL_OPEN)
 
-        available_slots = [(r, c) for r in range(self.rows) for c in range(self.cols) if self.matrix[r][c] == self.CELL_OPEN]
-        
+        available_slots = np.flatnonzero(self.matrix == self.CELL_OPEN)
         if len(available_slots) < 2:
             self.matrix.fill(self.CELL_OPEN)
-            available_slots = [(r, c) for r in range(self.rows) for c in range(self.cols)]
+            available_slots = np.arange(self.rows * self.cols)
 
-        self.start_pos = random.choice(available_slots)
-        available_slots.remove(self.start_pos)
-        self.goal_pos = random.choice(available_slots)
+        start_idx, goal_idx = rng.choice(available_slots, 2, replace=False)
+        self.start_pos = divmod(int(start_idx), self.cols)
+        self.goal_pos = divmod(int(goal_idx), self.cols)
 
         self.matrix[self.start_pos] = self.CELL_BEGIN
         self.matrix[self.goal_pos] = self.CELL_GOAL
-
-    def is_traversable(self, pos: Tuple[int, int]) -> bool:
-        """Checks if a position is within bounds and not a wall."""
-        r, c = pos
-        return 0 <= r < self.rows and 0 <= c < self.cols and self.matrix[r][c] != self.CELL_BLOCK
+        self.refresh_lookup_tables()
+
+    def refresh_lookup_tables(self):
+        """Rebuilds the cached wall mask, neighbour and step-cost data; call after editing the matrix directly."""
+        # Cell ids fit in a byte; keep one byte per cell even if a caller swapped in a wider matrix
+        if self.matrix.dtype != np.int8:
+            self.matrix = self.matrix.astype(np.int8)
+        self._free = np.ascontiguousarray(self.matrix != self.CELL_BLOCK)
+        self._blocked = ~self._free
+
+        # Bit k of a cell's mask is set when the cell and its step along OFFSETS[k] are both free,
+        # so every cell with the same mask shares the same relative neighbour deltas and step costs
+        rows, W = self.rows, self.cols
+        free = self._free
+        masks = np.zeros((rows, W), dtype=np.uint8)
+        steps = OFFSETS.tolist()
+        for k, (dr, dc) in enumerate(steps):
+            src = (slice(max(0, -dr), rows - max(0, dr)), slice(max(0, -dc), W - max(0, dc)))
+            dst = (slice(max(0, dr), rows + min(0, dr)), slice(max(0, dc), W + min(0, dc)))
+            masks[src] |= (free[src] & free[dst]).astype(np.uint8) << k
+
+        deltas = [dr * W + dc for dr, dc in steps]
+        weights = WEIGHTS.tolist()
+        mask_deltas = [tuple(d for k, d in enumerate(deltas) if m >> k & 1) for m in range(1 << len(steps))]
+        mask_costs = [tuple(w for k, w in enumerate(weights) if m >> k & 1) for m in range(1 << len(steps))]
+
+        # Free neighbours of every cell as packed r * cols + c indices (walls get an empty tuple),
+        # with the matching step costs in a parallel table
+        flat_masks = masks.ravel().tolist()
+        self.neighbor_table = [tuple([i + d for d in mask_deltas[m]]) for i, m in enumerate(flat_masks)]
+        self.edge_cost_table = [mask_costs[m] for m in flat_masks]
+
+    def reset(self, obstacles: List[Tuple[int, int]], start: Tuple[int, int], goal: Tuple[int, int]):
+        """Replaces the layout in place with the given obstacles and endpoints."""
+        self.matrix.fill(self.CELL_OPEN)
+        if obstacles:
+            cells = np.asarray(obstacles, dtype=np.intp)
+            self.matrix[cells[:, 0], cells[:, 1]] = self.CELL_BLOCK
+        self.start_pos, self.goal_pos = start, goal
+        self.matrix[start] = self.CELL_BEGIN
+        self.matrix[goal] = self.CELL_GOAL
+        self.refresh_lookup_tables()
+        self.clear_render_state()
+
+    def explored_count(self) -> int:
+        """Returns how many cells the last search marked as visited."""
+        return int(np.count_nonzero(self.cell_state >= self.STATE_VISITED))
 
     def clear_render_state(self):
         """Resets the data used for visualization."""
-        self.front_nodes.clear()
-        self.history.clear()
-        self.active_node = None
+        self.cell_state.fill(self.STATE_UNSEEN)
         self.trajectory = []
 
     def setup_gui_controls(self, search_engine):
@@ -111,50 +155,23 @@ class NavigationGrid:
             self.button_axes.append(ax_btn)
             self.buttons.append(btn)
 
-    def render_frame(self, header: str = "Search Visualization", delay: float = 0.05):
-        """Updates the visual output of the pathfinding progress."""
-        if self.display_fig is None or not plt.fignum_exists(self.display_fig.number):
-            self.display_fig, self.display_ax = plt.subplots(figsize=(14, 9))
-            plt.subplots_adjust(right=0.8, left=0.05)
-        else:
-            self.display_ax.clear()
-
-        # Define color palette
-        theme = np.ones((self.rows, self.cols, 3)) 
-
-        for r in range(self.rows):
-            for c in range(self.cols):
-                point = (r, c)
-                if self.matrix[r][c] == self.CELL_BLOCK:
-                    theme[r, c] = [0.1, 0.1, 0.1]
-                elif point == self.start_pos:
-                    theme[r, c] = [0.2, 0.8, 0.2]
-                elif point == self.goal_pos:
-                    theme[r, c] = [0.8, 0.2, 0.2]
-                elif point in self.trajectory:
-                    theme[r, c] = [1.0, 0.9, 0.0]
-                elif point == self.active_node:
-                    theme[r, c] = [1.0, 0.5, 0.0]
-                elif point in self.front_nodes:
-                    theme[r, c] = [0.5, 0.8, 0.9]
-                elif point in self.history:
-                    theme[r, c] = [0.8, 0.8, 0.8]
-
-        self.display_ax.imshow(theme, interpolation='nearest')
-        self.display_ax.set_title(header, fontsize=16, fontweight='bold')
-        self.display_ax.set_xticks(np.arange(-0.5, self.cols, 1), minor=True)
-        self.display_ax.set_yticks(np.arange(-0.5, self.rows, 1), minor=True)
-        self.display_ax.grid(which='minor', color='#CCCCCC', linestyle='-', linewidth=0.5)
-        self.display_ax.tick_params(which='both', size=0, labelsize=0)
-
-        if self.start_pos: 
-            self.display_ax.text(self.start_pos[1], self.start_pos[0], 'START', ha='center', va='center', color='black', fontsize=8, fontweight='bold')
-        if self.goal_pos: 
-            self.display_ax.text(self.goal_pos[1], self.goal_pos[0], 'END', ha='center', va='center', color='black', fontsize=8, fontweight='bold')
-
-        if self.trajectory:
-            path_pts = np.array(self.trajectory)
-            self.display_ax.plot(path_pts[:, 1], path_pts[:, 0], color='#FFD700', linewidth=4, alpha=0.7)
+    def _build_artists(self):
+        """Creates the figure's artists once; later frames only update their data."""
+        ax = self.display_ax
+        ax.tick_params(which='both', size=0, labelsize=0)
+
+        # Everything drawn over the static background is animated and repainted by blitting
+        self._im = ax.imshow(np.ones((self.rows, self.cols, 3), dtype=np.float32), interpolation='nearest', animated=True)
+        grid_style = dict(color='#CCCCCC', linestyle='-', linewidth=0.5, animated=True)
+        self._grid_lines = [
+            ax.hlines(np.arange(-0.5, self.rows, 1), -0.5, self.cols - 0.5, **grid_style),
+            ax.vlines(np.arange(-0.5, self.cols, 1), -0.5, self.rows - 0.5, **grid_style),
+        ]
+        self._path_line, = ax.plot([], [], color='#FFD700', linewidth=4, alpha=0.7, animated=True)
+        label_style = dict(ha='center', va='center', color='black', fontsize=8, fontweight='bold', animated=True)
+        self._start_text = ax.text(0, 0, 'START', **label_style)
+        self._goal_text = ax.text(0, 0, 'END', **label_style)
+        self._animated = [self._im, *self._grid_lines, self._path_line, self._start_text, self._goal_text]
 
         visual_keys = [
             mpatches.Patch(color='#33CC33', label='Origin'),
@@ -165,8 +182,62 @@ class NavigationGrid:
             mpatches.Patch(color='#FF8000', label='Current Inspect'),
             mpatches.Patch(color='#FFD700', label='Resulting Path')
         ]
-        self.display_ax.legend(handles=visual_keys, loc='upper left', bbox_to_anchor=(1.02, 0.2))
+        ax.legend(handles=visual_keys, loc='upper left', bbox_to_anchor=(1.02, 0.2))
+
+        self._header = None
+        self._background = None
+        self.display_fig.canvas.mpl_connect('draw_event', self._on_full_draw)
+
+    def _on_full_draw(self, event):
+        """Captures the static background after a full redraw and repaints the animated layers."""
+        self._background = self.display_fig.canvas.copy_from_bbox(self.display_ax.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        """Draws the per-frame artists on top of the current canvas contents."""
+        for artist in self._animated:
+            self.display_ax.draw_artist(artist)
+
+    def render_frame(self, header: str = "Search Visualization", delay: float = 0.05):
+        """Updates the visual output of the pathfinding progress."""
+        if self.display_fig is None or not plt.fignum_exists(self.display_fig.number):
+            self.display_fig, self.display_ax = plt.subplots(figsize=(14, 9))
+            plt.subplots_adjust(right=0.8, left=0.05)
+            self._build_artists()
 
-        plt.draw()
+        # Define color palette; layers are painted lowest priority first so later ones win
+        theme = self.STATE_PALETTE[self.cell_state]
+        if self.trajectory:
+            path_pts = np.array(self.trajectory, dtype=np.intp)
+            theme[path_pts[:, 0], path_pts[:, 1]] = (1.0, 0.9, 0.0)
+            self._path_line.set_data(path_pts[:, 1], path_pts[:, 0])
+        else:
+            self._path_line.set_data([], [])
+        if self.goal_pos:
+            theme[self.goal_pos] = (0.8, 0.2, 0.2)
+        if self.start_pos:
+            theme[self.start_pos] = (0.2, 0.8, 0.2)
+        theme[self._blocked] = (0.1, 0.1, 0.1)
+        self._im.set_data(theme)
+
+        for label, pos in ((self._start_text, self.start_pos), (self._goal_text, self.goal_pos)):
+            label.set_visible(bool(pos))
+            if pos:
+                label.set_position((pos[1], pos[0]))
+
+        canvas = self.display_fig.canvas
+        if header != self._header or self._background is None or not canvas.supports_blit:
+            # Title lives outside the axes, so a new header needs a full redraw
+            self._header = header
+            self.display_ax.set_title(header, fontsize=16, fontweight='bold')
+            canvas.draw_idle()
+            if delay > 0:
+                plt.pause(delay)
+            return
+
+        canvas.restore_region(self._background)
+        self._draw_animated()
+        canvas.blit(self.display_ax.bbox)
+        canvas.flush_events()
         if delay > 0:
-            plt.pause(delay)
\ No newline at end of file
+            canvas.start_event_loop(delay)
\ No newline at end of file
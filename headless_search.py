@@ -0,0 +1,79 @@
+from array import array
+from collections import deque
+import heapq
+from typing import List, Optional, Sequence, Tuple
+from utils import SearchState
+
+# Headless search kernels used when no animation is requested.
+# They work purely on packed r * cols + c indices and the grid's neighbour table,
+# record the order in which cells are expanded, and return a flat parent buffer
+# (parent[origin] == origin, -1 for unreached cells) or None when the goal is unreachable.
+
+def bfs_kernel(neighbors: Sequence[Tuple[int, ...]], origin: int, goal: int, expanded: List[int]) -> Optional[array]:
+    """Breadth-first search over a packed neighbour table."""
+    parent = array('i', [-1]) * len(neighbors)
+    parent[origin] = origin
+    if origin == goal:
+        expanded.append(goal)
+        return parent
+    queue = deque([origin])
+    while queue:
+        pos = queue.popleft()
+        expanded.append(pos)
+        for nxt in neighbors[pos]:
+            if parent[nxt] == -1:
+                parent[nxt] = pos
+                # Unit step costs: the goal's first discovery is already a shortest path
+                if nxt == goal:
+                    expanded.append(goal)
+                    return parent
+                queue.append(nxt)
+    return None
+
+def dfs_kernel(neighbors: Sequence[Tuple[int, ...]], origin: int, goal: int, expanded: List[int]) -> Optional[array]:
+    """Depth-first search over a packed neighbour table; a cell already on the stack is not pushed again."""
+    parent = array('i', [-1]) * len(neighbors)
+    parent[origin] = origin
+    visited = bytearray(len(neighbors))
+    stacked = bytearray(len(neighbors))
+    stacked[origin] = 1
+    stack = [origin]
+    while stack:
+        pos = stack.pop()
+        stacked[pos] = 0
+        visited[pos] = 1
+        expanded.append(pos)
+        if pos == goal:
+            return parent
+        for adj in reversed(neighbors[pos]):
+            if not stacked[adj] and not visited[adj]:
+                stacked[adj] = 1
+                parent[adj] = pos
+                stack.append(adj)
+    return None
+
+def ucs_kernel(neighbors: Sequence[Tuple[int, ...]], origin: int, goal: int, expanded: List[int],
+               edge_costs: Sequence[Tuple[float, ...]]) -> Optional[array]:
+    """Uniform-cost search over a packed neighbour table and its parallel step-cost table."""
+    search = SearchState(len(neighbors), origin)
+    parent, costs = search.parent, search.cost
+    heap = [(0, 0, origin)]
+    counter = 0
+    # Module functions and bound methods hoisted out of the loop to skip an attribute lookup per call
+    heappush, heappop, record = heapq.heappush, heapq.heappop, expanded.append
+    while heap:
+        base_cost, _, pos = heappop(heap)
+        # Entries superseded by a cheaper push are stale; a settled cell is never improved again
+        if base_cost > costs[pos]:
+            continue
+        record(pos)
+        if pos == goal:
+            return parent
+        for nxt, step_cost in zip(neighbors[pos], edge_costs[pos]):
+            new_cost = base_cost + step_cost
+            if new_cost < costs[nxt]:
+                costs[nxt] = new_cost
+                parent[nxt] = pos
+                counter += 1
+                heappush(heap, (new_cost, counter, nxt))
+    return None
\ No newline at end of file